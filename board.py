@@ -1,3 +1,29 @@
+from piece import Piece
+from constants import ROWS, COLS
+
+
+# starting layout of one player's stones, from the row nearest that player's edge inward, for columns b to s
+STARTING_ROWS = [" X X XXXXXXXX X X ",
+                 "XXX X XXXX X X XXX",
+                 " X X XXXXXXXX X X ",
+                 "                  ",
+                 "                  ",
+                 " X  X  X  X  X  X "]
+
+
+def column_label(index):
+    """
+    Converts a column number into a spreadsheet-style label: 1 is 'a', 26 is 'z', 27 is 'aa', and so on.
+    :param index: column number, starting from 1
+    :return: string label of the column
+    """
+    label = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(ord('a') + remainder) + label
+    return label
+
+
 class Board:
     """
     The Board class has one data member: the board of a GessGame object.
@@ -5,37 +31,39 @@ class Board:
     The Board class manages the state of the game board by adding and removing game Piece objects.
     The Board class needs to communicate with a the Piece class in order to add a Piece, but removing a Piece can be
     done without communication with the Piece class.
+    The Board class also keeps a set of the locations of each player's stones, so that ring checks scale with the
+    number of stones on the board rather than with the size of the board.
     """
 
-    def __init__(self):
+    def __init__(self, rows=ROWS, cols=COLS):
         """
         Initializes the board data member of the board class.
-        The board is a list of lists.
+        The board is a list of lists with one more row and column than the playing area.
         The top row and left column are completely inaccessible to the GessGame class, and are only there for playing
         purposes.
+        The starting stones are centered horizontally, so boards wider than 20 columns get the standard setup.
+        :param rows: number of rows on the board, including the out of bounds perimeter (at least 20)
+        :param cols: number of columns on the board, including the out of bounds perimeter (at least 20)
         """
-        self._board = [
-            [' ', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't'],
-            [20, '  ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [19, '  ', ' ', 'W', ' ', 'W', ' ', 'W', 'W', 'W', 'W', 'W', 'W', 'W', 'W', ' ', 'W', ' ', 'W', ' ', ' '],
-            [18, '  ', 'W', 'W', 'W', ' ', 'W', ' ', 'W', 'W', 'W', 'W', ' ', 'W', ' ', 'W', ' ', 'W', 'W', 'W', ' '],
-            [17, '  ', ' ', 'W', ' ', 'W', ' ', 'W', 'W', 'W', 'W', 'W', 'W', 'W', 'W', ' ', 'W', ' ', 'W', ' ', ' '],
-            [16, '  ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [15, '  ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [14, '  ', ' ', 'W', ' ', ' ', 'W', ' ', ' ', 'W', ' ', ' ', 'W', ' ', ' ', 'W', ' ', ' ', 'W', ' ', ' '],
-            [13, '  ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [12, '  ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [11, '  ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [10, '  ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [9, '   ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [8, '   ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [7, '   ', ' ', 'B', ' ', ' ', 'B', ' ', ' ', 'B', ' ', ' ', 'B', ' ', ' ', 'B', ' ', ' ', 'B', ' ', ' '],
-            [6, '   ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [5, '   ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' '],
-            [4, '   ', ' ', 'B', ' ', 'B', ' ', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', ' ', 'B', ' ', 'B', ' ', ' '],
-            [3, '   ', 'B', 'B', 'B', ' ', 'B', ' ', 'B', 'B', 'B', 'B', ' ', 'B', ' ', 'B', ' ', 'B', 'B', 'B', ' '],
-            [2, '   ', ' ', 'B', ' ', 'B', ' ', 'B', 'B', 'B', 'B', 'B', 'B', 'B', 'B', ' ', 'B', ' ', 'B', ' ', ' '],
-            [1, '   ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ']]
+        if rows < 20 or cols < 20:
+            raise ValueError("board must be at least 20x20")
+
+        self._rows = rows
+        self._cols = cols
+        self._stones = {'W': set(), 'B': set()}
+
+        self._board = [[' '] + [column_label(col) for col in range(1, cols + 1)]]
+        for label in range(rows, 0, -1):
+            # pad the out of bounds column so the printed board lines up
+            padding = ' ' * (len(str(rows)) - len(str(label)) + 2)
+            self._board.append([label, padding] + [' '] * (cols - 1))
+
+        offset = 2 + (cols - 2 - len(STARTING_ROWS[0])) // 2
+        for step, pattern in enumerate(STARTING_ROWS):
+            for position, space in enumerate(pattern):
+                if space == 'X':
+                    self.set_stone([2 + step, offset + position], 'W')
+                    self.set_stone([rows - 1 - step, offset + position], 'B')
 
     def get_game_board(self):
         """
@@ -43,56 +71,139 @@ class Board:
         """
         return self._board
 
+    def get_rows(self):
+        """
+        :return: number of rows on the board
+        """
+        return self._rows
+
+    def get_cols(self):
+        """
+        :return: number of columns on the board
+        """
+        return self._cols
+
+    def get_stones(self, color):
+        """
+        :param color: color of the stones ("W" or "B")
+        :return: set of (row, column) tuples of every stone of that color on the board
+        """
+        return self._stones[color]
+
+    def in_bounds(self, location):
+        """
+        Checks whether a piece centered at the location fits entirely within the board data member.
+        :param location: list of two integers indicating location on the board
+        :return: True if every square of the piece is on the board data member; False otherwise
+        """
+        return 1 <= location[0] < self._rows and 1 <= location[1] < self._cols
+
+    def on_board(self, location):
+        """
+        Checks whether the center of a piece is on the playable part of the board - inside the perimeter.
+        :param location: list of two integers indicating location on the board
+        :return: True if the center is on the playable part of the board; False otherwise
+        """
+        return 2 <= location[0] < self._rows and 2 <= location[1] < self._cols
+
+    def set_stone(self, location, stone):
+        """
+        Sets one square of the board, keeping the sets of stone locations up to date.
+        :param location: list of two integers indicating location on the board
+        :param stone: contents of the square ("W", "B", or a string of one space for no stone)
+        """
+        row, col = location
+        old = self._board[row][col]
+        if old in self._stones:
+            self._stones[old].discard((row, col))
+        if stone in self._stones:
+            self._stones[stone].add((row, col))
+        self._board[row][col] = stone
+
+    def copy_board(self):
+        """
+        :return: a copy of the board data member that later changes to the board will not affect
+        """
+        return [row[:] for row in self._board]
+
+    def restore_board(self, board):
+        """
+        Replaces the board data member with a copy of a board made by copy_board, rebuilding the stone locations.
+        :param board: board data member (list of lists) returned by copy_board
+        """
+        self._board = [row[:] for row in board]
+        self._stones = {'W': set(), 'B': set()}
+        for row in range(1, self._rows + 1):
+            for col in range(1, self._cols + 1):
+                if self._board[row][col] in self._stones:
+                    self._stones[self._board[row][col]].add((row, col))
+
+    def has_ring(self, color):
+        """
+        Checks whether a player has a ring anywhere on the board.
+        Every ring has a stone directly west of its center, so only squares directly east of a stone of the player
+        need to be checked.
+        :param color: color of the player being checked
+        :return: True if the player has a ring; False if the player has no ring
+        """
+        for row, col in self._stones[color]:
+            center = [row, col + 1]
+            # rings are only possible where the whole ring is inside the perimeter
+            if 3 <= center[0] < self._rows - 1 and 3 <= center[1] < self._cols - 1:
+                if Piece(center, self._board).is_ring(color):
+                    return True
+        return False
+
     def remove_piece(self, location):
         """
         Removes a piece centered at the coordinates specified by the input parameter.
         The center and all surrounding "squares" are filled with a string of one space, which indicates no stone.
         :param location: list of two integers indicating location on the board
         """
-        self._board[location[0]][location[1]] = ' '
-        self._board[location[0] + 1][location[1]] = ' '
-        self._board[location[0] + 1][location[1] + 1] = ' '
-        self._board[location[0] + 1][location[1] - 1] = ' '
-        self._board[location[0]][location[1] + 1] = ' '
-        self._board[location[0] - 1][location[1]] = ' '
-        self._board[location[0] - 1][location[1] + 1] = ' '
-        self._board[location[0] - 1][location[1] - 1] = ' '
-        self._board[location[0]][location[1] - 1] = ' '
+        self.set_stone([location[0], location[1]], ' ')
+        self.set_stone([location[0] + 1, location[1]], ' ')
+        self.set_stone([location[0] + 1, location[1] + 1], ' ')
+        self.set_stone([location[0] + 1, location[1] - 1], ' ')
+        self.set_stone([location[0], location[1] + 1], ' ')
+        self.set_stone([location[0] - 1, location[1]], ' ')
+        self.set_stone([location[0] - 1, location[1] + 1], ' ')
+        self.set_stone([location[0] - 1, location[1] - 1], ' ')
+        self.set_stone([location[0], location[1] - 1], ' ')
 
     def add_piece(self, piece, location):
         """
         Adds the attributes of a Piece object to the board attribute of a Board object.
-        The piece is only added if its center is on the board - b to s horizontally and 2 to 19 vertically.
+        The piece is only added if its center is on the board - inside the out of bounds perimeter.
         Piece perimeter attributes are not added if they are off the board,
         but the portion of the perimeter that is on the board is added.
         :param piece: a Piece object
         :param location: list of two integers indicating location on the board
         """
         # if the center of the piece is being added to a valid spot on the board...
-        if location[0] in range(2, 20) and location[1] in range(2, 20):
-            self._board[location[0]][location[1]] = piece.get_piece_center()
+        if self.on_board(location):
+            self.set_stone([location[0], location[1]], piece.get_piece_center())
 
             # then add the center, plus any other part of the piece that is not off the board
-            if location[0] - 1 in range(2, 20) and location[1] in range(2, 20):
-                self._board[location[0] - 1][location[1]] = piece.get_piece_N()
+            if self.on_board([location[0] - 1, location[1]]):
+                self.set_stone([location[0] - 1, location[1]], piece.get_piece_N())
 
-            if location[0] - 1 in range(2, 20) and location[1] - 1 in range(2, 20):
-                self._board[location[0] - 1][location[1] - 1] = piece.get_piece_NW()
+            if self.on_board([location[0] - 1, location[1] - 1]):
+                self.set_stone([location[0] - 1, location[1] - 1], piece.get_piece_NW())
 
-            if location[0] - 1 in range(2, 20) and location[1] + 1 in range(2, 20):
-                self._board[location[0] - 1][location[1] + 1] = piece.get_piece_NE()
+            if self.on_board([location[0] - 1, location[1] + 1]):
+                self.set_stone([location[0] - 1, location[1] + 1], piece.get_piece_NE())
 
-            if location[0] + 1 in range(2, 20) and location[1] in range(2, 20):
-                self._board[location[0] + 1][location[1]] = piece.get_piece_S()
+            if self.on_board([location[0] + 1, location[1]]):
+                self.set_stone([location[0] + 1, location[1]], piece.get_piece_S())
 
-            if location[0] + 1 in range(2, 20) and location[1] - 1 in range(2, 20):
-                self._board[location[0] + 1][location[1] - 1] = piece.get_piece_SW()
+            if self.on_board([location[0] + 1, location[1] - 1]):
+                self.set_stone([location[0] + 1, location[1] - 1], piece.get_piece_SW())
 
-            if location[0] + 1 in range(2, 20) and location[1] + 1 in range(2, 20):
-                self._board[location[0] + 1][location[1] + 1] = piece.get_piece_SE()
+            if self.on_board([location[0] + 1, location[1] + 1]):
+                self.set_stone([location[0] + 1, location[1] + 1], piece.get_piece_SE())
 
-            if location[0] in range(2, 20) and location[1] + 1 in range(2, 20):
-                self._board[location[0]][location[1] + 1] = piece.get_piece_E()
+            if self.on_board([location[0], location[1] + 1]):
+                self.set_stone([location[0], location[1] + 1], piece.get_piece_E())
 
-            if location[0] in range(2, 20) and location[1] - 1 in range(2, 20):
-                self._board[location[0]][location[1] - 1] = piece.get_piece_W()
+            if self.on_board([location[0], location[1] - 1]):
+                self.set_stone([location[0], location[1] - 1], piece.get_piece_W())
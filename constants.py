@@ -11,4 +11,7 @@ BEIGE = (224, 194, 119)
 TAN = (237, 174, 114)
 BLACK = B = (0, 0, 0)
 WHITE = W = (255, 255, 255)
-TEST = (230, 218, 190)
\ No newline at end of file
+TEST = (230, 218, 190)
+
+# number of moves between full board snapshots in the game history
+KEYFRAME_INTERVAL = 10
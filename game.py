@@ -1,5 +1,6 @@
 import pygame
 from board import Board
+from history import GameHistory
 from piece import Piece
 from stone import Stone
 from constants import *
@@ -14,43 +15,56 @@ class GessGame:
     GessGame methods for checking the game state or resigning the game do not require communication with other classes.
     """
 
-    def __init__(self, win):
+    def __init__(self, win, rows=ROWS, cols=COLS):
         """
         Initializes the data members of a GessGame object.
-        board - stored in a Board object.
+        board - stored in a Board object, rows by cols in size.
+        square_size - size in pixels of one square, so that the whole board fits in the window
         game_state - who, if anyone, won the game
         whose_turn - player whose turn it is to make a move
         up_next - player who is not currently authorized to make a move
         direction - direction of the move being made (list of two integers)
         distance - distance of the move being made
+        history - stored in a GameHistory object, for reviewing and replaying the game
+        font - font of the message window, loaded the first time it is rendered
         """
-        self._board = Board()
+        self._board = Board(rows, cols)
         self._win = win
+        self._square_size = min(WIDTH // cols, (HEIGHT - MESSAGE_WINDOW) // rows)
         self._game_state = "UNFINISHED"
         self._whose_turn = "B"
         self._up_next = "W"
         self._selected = None
         self._direction = None
         self._distance = None
+        self._history = GameHistory(self._board, self.get_turn_state())
+        self._font = None
 
     def update(self):
         """
         Displays the board in its current state to the user.
         """
+        size = self._square_size
+        rows = self._board.get_rows()
+        cols = self._board.get_cols()
+
         self._win.fill(BEIGE)  # fill board with background color
         self.render_font()
         if self._selected:  # fill selected piece with background color
             self._win.fill(TAN,
-                           (self._selected[1] * SQUARE_SIZE - SQUARE_SIZE, self._selected[0] * SQUARE_SIZE - SQUARE_SIZE, SQUARE_SIZE * 3, SQUARE_SIZE * 3))
-        for row in range(20):
-            for col in range(20):
-                pygame.draw.rect(self._win,
-                                 BLACK,
-                                 (row * SQUARE_SIZE, col * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE),
-                                 1)
-                if self._board.get_game_board()[row + 1][col + 1] == 'W' or self._board.get_game_board()[row + 1][col + 1] == 'B':
-                    stone = Stone(row, col, self._board.get_game_board()[row + 1][col + 1])
-                    stone.draw(self._win)
+                           (self._selected[1] * size - size, self._selected[0] * size - size, size * 3, size * 3))
+
+        # draw the grid one line at a time rather than one square at a time
+        for row in range(rows + 1):
+            pygame.draw.line(self._win, BLACK, (0, row * size), (cols * size, row * size))
+        for col in range(cols + 1):
+            pygame.draw.line(self._win, BLACK, (col * size, 0), (col * size, rows * size))
+
+        # only visit the squares that have stones
+        for color in ("W", "B"):
+            for row, col in self._board.get_stones(color):
+                stone = Stone(row - 1, col - 1, color, size)
+                stone.draw(self._win)
 
         pygame.display.update()
 
@@ -70,18 +84,24 @@ class GessGame:
         else:
             text = "White Won!"
 
+        top = self._board.get_rows() * self._square_size
         self._win.fill(TEST,
-                       (0, 20 * SQUARE_SIZE, SQUARE_SIZE * 20, 100))
-        pygame.font.init()
-        font = pygame.font.Font("font/ARCADE.TTF", 72)
-        img = font.render(text, True, BLACK)
-        self._win.blit(img, (5.25 * SQUARE_SIZE, 20.5 * SQUARE_SIZE))
+                       (0, top, self._board.get_cols() * self._square_size, MESSAGE_WINDOW))
+        if self._font is None:  # loading the font every frame makes scrubbing through the history lag
+            pygame.font.init()
+            self._font = pygame.font.Font("font/ARCADE.TTF", 72)
+        img = self._font.render(text, True, BLACK)
+        self._win.blit(img, (5.25 * SQUARE_SIZE, top + 0.5 * SQUARE_SIZE))
 
     def select(self, row, col):
         """
         When a piece is selected, its center position is saved for later use as "start" in make_move().
         On the second click, the piece is moved if the move is valid. Otherwise, the piece is deselected.
+        Clicks too close to the edge of the board (or below it) select nothing.
         """
+        if not self._board.in_bounds((row+1, col+1)):
+            self._selected = None
+            return
         piece = Piece((row+1, col+1), self._board.get_game_board())
         if not self._selected:
             if piece.is_empty():
@@ -98,6 +118,55 @@ class GessGame:
         """
         return self._board
 
+    def get_history(self):
+        """
+        :return: the GameHistory object associated with an instance of GessGame object
+        """
+        return self._history
+
+    def get_turn_state(self):
+        """
+        :return: tuple of whose_turn, up_next, and game_state
+        """
+        return self._whose_turn, self._up_next, self._game_state
+
+    def seek(self, ply):
+        """
+        Puts the game at the position after a number of moves in the line of play being reviewed.
+        Making a move from an earlier position starts a new variation.
+        :param ply: number of moves from the starting position
+        """
+        self._selected = None
+        self._whose_turn, self._up_next, self._game_state = self._history.seek(ply)
+
+    def step_forward(self):
+        """
+        Puts the game at the position one move later in the line of play being reviewed.
+        """
+        self.seek(self._history.get_ply() + 1)
+
+    def step_back(self):
+        """
+        Puts the game at the position one move earlier.
+        """
+        self.seek(self._history.get_ply() - 1)
+
+    def change_variation(self, step):
+        """
+        Cycles through the variations played from the current position, choosing which one step_forward follows.
+        :param step: number of variations to move through (negative to cycle backwards)
+        """
+        variations = self._history.get_variations()
+        if variations:
+            index = (self._history.get_selected_variation() + step) % len(variations)
+            self._history.select_variation(index)
+
+    def get_square_size(self):
+        """
+        :return: size in pixels of one square of the board
+        """
+        return self._square_size
+
     def get_game_state(self):
         """
         :return: a string indicating which player has won, or that the game is unfinished
@@ -123,6 +192,7 @@ class GessGame:
         Validity of direction of movement is determined by checking the orientation of the footprint of a Piece object.
         Validity of distance is determined by whether the piece has a center stone and the attempted distance.
         A move cannot break the mover's own last ring.
+        A legal move is recorded in the history as the squares it changed.
         :param start: the starting coordinate of the piece to be moved (list of two integers)
         :param end: the ending coordinate of the piece to be moved (list of two integers)
         :return: True if valid move-request; False if invalid move-request
@@ -135,9 +205,11 @@ class GessGame:
             return False
 
         # if the move is not on the board
-        if start[0] > 19 or start[0] < 1 or start[1] > 20 or start[1] < 1:
+        if not self._board.in_bounds(start):
             return False
-        if end[0] > 19 or end[0] < 1 or end[1] > 20 or end[1] < 1:
+        rows = self._board.get_rows()
+        cols = self._board.get_cols()
+        if end[0] > rows - 1 or end[0] < 1 or end[1] > cols or end[1] < 1:
             return False
 
         # if the piece has stones of the opponent
@@ -147,10 +219,39 @@ class GessGame:
 
         # if the direction and distance are valid, attempt the move
         if self.valid_direction(start, end) and self.valid_distance(start, end):
-            return self.board_step(start, end)
+            # only the squares of the piece at the start and end of the move can change
+            squares = self.piece_squares(start) + self.piece_squares(end)
+            before = [self._board.get_game_board()[row][col] for row, col in squares]
+
+            if not self.board_step(start, end):
+                # board_step cannot put back parts of the piece that are off the board, so restore them here
+                for (row, col), old in zip(squares, before):
+                    self._board.set_stone([row, col], old)
+                return False
+
+            # record the move in the history as the squares it changed
+            changes = []
+            for (row, col), old in zip(squares, before):
+                new = self._board.get_game_board()[row][col]
+                if old != new and (row, col, old, new) not in changes:
+                    changes.append((row, col, old, new))
+            self._history.record((start[0]-1, start[1]-1, end[0]-1, end[1]-1), tuple(changes), self.get_turn_state())
+            return True
         else:
             return False
 
+    def piece_squares(self, location):
+        """
+        :param location: the center coordinate of a piece (list of two integers)
+        :return: list of (row, column) tuples of the squares of the piece that are on the board data member
+        """
+        squares = []
+        for row in range(location[0] - 1, location[0] + 2):
+            for col in range(location[1] - 1, location[1] + 2):
+                if 0 <= row <= self._board.get_rows() and 0 <= col <= self._board.get_cols():
+                    squares.append((row, col))
+        return squares
+
     def valid_direction(self, start, end):
         """
         Checks whether the direction of a requested move is valid.
@@ -314,7 +415,7 @@ class GessGame:
     def still_in(self, game_board, moving_piece):
         """
         Checks if each player is still in the game.
-        This is done by making a piece object at each valid spot on the board and checking for a ring.
+        This is done by making a piece object next to each of the player's stones and checking for a ring.
         Changes game_state if the player who made the move breaks the other player's last ring.
         This version of the function is called before a move is finalized (piece not yet placed in final destination).
         :param game_board: a board object
@@ -323,19 +424,14 @@ class GessGame:
 
         def check_piece(color, moving_piece=None):
             """
-            Makes a temporary piece at each valid spot on the board, checking if the piece is a ring.
+            Checks the board for a ring of the player, only looking next to the player's stones.
             :param color: color of the player being checked
             :param moving_piece: saves active player's moving piece so that if it's a ring the function will return True
             :return: True if the player has a ring; False if the player has no ring
             """
             if moving_piece and moving_piece.is_ring(color):  # if active player is moving their ring
                 return True
-            for row in range(3, 19):
-                for column in range(3, 19):  # for every square on the board where rings are possible
-                    ring_check = Piece([row, column], game_board.get_game_board())  # make a piece
-                    if ring_check.is_ring(color):  # check if the piece is a ring
-                        return True
-            return False
+            return game_board.has_ring(color)
 
         if check_piece(self._whose_turn, moving_piece):  # if the move didn't break the mover's own last ring
             if not check_piece(self._up_next):  # if the move broke the opponent's last ring
@@ -354,7 +450,7 @@ class GessGame:
     def still_in_double_check(self, game_board):
         """
         Checks if each player is still in the game.
-        This is done by making a piece object at each valid spot on the board and checking for a ring.
+        This is done by making a piece object next to each of the player's stones and checking for a ring.
         Changes game_state if the player who made the move breaks the other player's last ring.
         This version of the function is called after a move is finalized (piece placed in final destination).
         This is because the ring of the opponent won't be broken until the moving piece is finally set.
@@ -364,16 +460,11 @@ class GessGame:
 
         def check_piece(color):
             """
-            Makes a temporary piece at each valid spot on the board, checking if the piece is a ring.
+            Checks the board for a ring of the player, only looking next to the player's stones.
             :param color: color of the player being checked
             :return: True if the player has a ring; False if the player has no ring
             """
-            for row in range(3, 19):
-                for column in range(3, 19):  # for every square on the board where rings are possible
-                    ring_check = Piece([row, column], game_board.get_game_board())  # make a piece
-                    if ring_check.is_ring(color):  # check if the piece is a ring
-                        return True
-            return False
+            return game_board.has_ring(color)
 
         if check_piece(self._up_next):  # if the move didn't break the mover's own last ring
             if not check_piece(self._whose_turn):  # if the move broke the opponent's last ring
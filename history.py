@@ -0,0 +1,241 @@
+from constants import KEYFRAME_INTERVAL
+
+
+class HistoryNode:
+    """
+    The HistoryNode class stores one position in the history of a GessGame.
+    Each node stores the move that led to it as a list of changed squares, so it can be applied or undone quickly.
+    Every few moves a node also stores a full copy of the board (a keyframe), so no position is ever more than a few
+    moves away from a full board.
+    A node can have several children, one for each variation played from its position.
+    """
+
+    def __init__(self, parent, move, changes, state, snapshot=None):
+        """
+        Initializes the data members of a HistoryNode object.
+        parent - the HistoryNode before this one, or None for the starting position
+        move - the start and end coordinates of the move that led to this position
+        changes - tuple of (row, column, old stone, new stone) for every square the move changed
+        state - tuple of whose_turn, up_next, and game_state after the move
+        snapshot - full copy of the board, or None if this node is not a keyframe
+        children - HistoryNode objects for each move played from this position
+        selected - index of the child followed when stepping forward
+        """
+        self._parent = parent
+        self._move = move
+        self._changes = changes
+        self._state = state
+        self._snapshot = snapshot
+        self._children = []
+        self._selected = None
+
+    def get_parent(self):
+        """
+        :return: the HistoryNode before this one
+        """
+        return self._parent
+
+    def get_move(self):
+        """
+        :return: the start and end coordinates of the move that led to this position
+        """
+        return self._move
+
+    def get_state(self):
+        """
+        :return: tuple of whose_turn, up_next, and game_state after the move
+        """
+        return self._state
+
+    def get_snapshot(self):
+        """
+        :return: full copy of the board, or None if this node is not a keyframe
+        """
+        return self._snapshot
+
+    def get_children(self):
+        """
+        :return: list of HistoryNode objects for each move played from this position
+        """
+        return self._children
+
+    def get_selected_child(self):
+        """
+        :return: the child followed when stepping forward, or None if no move has been played from this position
+        """
+        if self._selected is None:
+            return None
+        return self._children[self._selected]
+
+    def get_selected_index(self):
+        """
+        :return: index of the child followed when stepping forward, or None if no move has been played
+        """
+        return self._selected
+
+    def select_child(self, index):
+        """
+        Chooses which child is followed when stepping forward.
+        :param index: index of the child in the list of children
+        """
+        self._selected = index
+
+    def add_child(self, child):
+        """
+        Adds a child and selects it.
+        :param child: a HistoryNode object
+        """
+        self._children.append(child)
+        self._selected = len(self._children) - 1
+
+    def apply(self, board):
+        """
+        Plays the move that led to this node on a Board object that is at the parent's position.
+        :param board: a Board object
+        """
+        for row, col, old, new in self._changes:
+            board.set_stone([row, col], new)
+
+    def undo(self, board):
+        """
+        Takes back the move that led to this node on a Board object that is at this node's position.
+        :param board: a Board object
+        """
+        for row, col, old, new in self._changes:
+            board.set_stone([row, col], old)
+
+
+class GameHistory:
+    """
+    The GameHistory class records every move of a GessGame so the game can be reviewed and replayed.
+    Moves are stored as HistoryNode objects in a tree, so playing a different move from an earlier position starts a
+    new variation instead of erasing the old one.
+    The line of play being reviewed is kept as a list of nodes, so any move can be found without walking the tree.
+    Seeking to a move restores the closest keyframe and applies at most KEYFRAME_INTERVAL - 1 moves.
+    """
+
+    def __init__(self, board, state, keyframe_interval=KEYFRAME_INTERVAL):
+        """
+        Initializes the data members of a GameHistory object.
+        board - the Board object that moves are applied to
+        keyframe_interval - number of moves between full board snapshots
+        line - list of HistoryNode objects from the starting position to the end of the line being reviewed
+        ply - number of moves from the starting position to the position on the board
+        :param board: a Board object at the starting position
+        :param state: tuple of whose_turn, up_next, and game_state at the starting position
+        :param keyframe_interval: number of moves between full board snapshots
+        """
+        if keyframe_interval < 1:
+            raise ValueError("keyframe interval must be at least 1")
+
+        self._board = board
+        self._keyframe_interval = keyframe_interval
+        self._line = [HistoryNode(None, None, (), state, board.copy_board())]
+        self._ply = 0
+
+    def get_ply(self):
+        """
+        :return: number of moves from the starting position to the position on the board
+        """
+        return self._ply
+
+    def get_length(self):
+        """
+        :return: number of moves in the line being reviewed
+        """
+        return len(self._line) - 1
+
+    def get_moves(self):
+        """
+        :return: list of the start and end coordinates of every move in the line being reviewed
+        """
+        return [node.get_move() for node in self._line[1:]]
+
+    def get_variations(self):
+        """
+        :return: list of the start and end coordinates of every move played from the position on the board
+        """
+        return [node.get_move() for node in self._line[self._ply].get_children()]
+
+    def get_selected_variation(self):
+        """
+        :return: index of the variation followed when stepping forward, or None if no move has been played
+        """
+        return self._line[self._ply].get_selected_index()
+
+    def record(self, move, changes, state):
+        """
+        Records a move that was just played on the board.
+        If the move was played from an earlier position, it starts a new variation from that position,
+        unless the same move was already played there, in which case that variation is followed.
+        :param move: the start and end coordinates of the move
+        :param changes: tuple of (row, column, old stone, new stone) for every square the move changed
+        :param state: tuple of whose_turn, up_next, and game_state after the move
+        """
+        current = self._line[self._ply]
+        for index, child in enumerate(current.get_children()):
+            if child.get_move() == move:
+                current.select_child(index)
+                break
+        else:
+            snapshot = None
+            if (self._ply + 1) % self._keyframe_interval == 0:
+                snapshot = self._board.copy_board()
+            current.add_child(HistoryNode(current, move, changes, state, snapshot))
+
+        self._follow_line()
+        self._ply += 1
+
+    def select_variation(self, index):
+        """
+        Chooses which variation is followed when stepping forward from the position on the board.
+        :param index: index of the variation in the list returned by get_variations
+        """
+        self._line[self._ply].select_child(index)
+        self._follow_line()
+
+    def seek(self, ply):
+        """
+        Puts the board at the position after a number of moves in the line being reviewed.
+        The board is either stepped from its position or restored from the closest earlier keyframe,
+        whichever applies fewer moves.
+        :param ply: number of moves from the starting position (clamped to the line being reviewed)
+        :return: tuple of whose_turn, up_next, and game_state at the new position
+        """
+        ply = max(0, min(ply, self.get_length()))
+        keyframe = ply - ply % self._keyframe_interval
+
+        if abs(ply - self._ply) > ply - keyframe:
+            self._board.restore_board(self._line[keyframe].get_snapshot())
+            self._ply = keyframe
+
+        while self._ply < ply:
+            self._ply += 1
+            self._line[self._ply].apply(self._board)
+        while self._ply > ply:
+            self._line[self._ply].undo(self._board)
+            self._ply -= 1
+
+        return self._line[self._ply].get_state()
+
+    def step_forward(self):
+        """
+        :return: tuple of whose_turn, up_next, and game_state after stepping one move forward
+        """
+        return self.seek(self._ply + 1)
+
+    def step_back(self):
+        """
+        :return: tuple of whose_turn, up_next, and game_state after stepping one move back
+        """
+        return self.seek(self._ply - 1)
+
+    def _follow_line(self):
+        """
+        Rebuilds the line being reviewed after the position on the board, following the selected child of each node.
+        """
+        del self._line[self._ply + 1:]
+        node = self._line[self._ply].get_selected_child()
+        while node is not None:
+            self._line.append(node)
+            node = node.get_selected_child()
@@ -1,24 +1,26 @@
 import pygame
 from game import GessGame
-from constants import WIDTH, HEIGHT, SQUARE_SIZE
+from constants import WIDTH, HEIGHT, ROWS, COLS
 
 FPS = 30
+SEEK_JUMP = 10  # number of moves skipped by page up and page down
 
 WIN = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Gess")
 
 
-def get_row_col_from_click(pos):
+def get_row_col_from_click(pos, square_size):
     x, y = pos
-    row = y // SQUARE_SIZE
-    col = x // SQUARE_SIZE
+    row = y // square_size
+    col = x // square_size
     return row, col
 
 
-def main():
+def main(rows=ROWS, cols=COLS):
     run = True
     clock = pygame.time.Clock()
-    game = GessGame(WIN)
+    game = GessGame(WIN, rows, cols)
+    pygame.key.set_repeat(250, 50)  # holding an arrow key scrubs through the game
 
     while run:
         clock.tick(FPS)
@@ -29,9 +31,27 @@ def main():
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 pos = pygame.mouse.get_pos()
-                row, col = get_row_col_from_click(pos)
+                row, col = get_row_col_from_click(pos, game.get_square_size())
                 game.select(row, col)
 
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_LEFT:
+                    game.step_back()
+                elif event.key == pygame.K_RIGHT:
+                    game.step_forward()
+                elif event.key == pygame.K_PAGEUP:
+                    game.seek(game.get_history().get_ply() - SEEK_JUMP)
+                elif event.key == pygame.K_PAGEDOWN:
+                    game.seek(game.get_history().get_ply() + SEEK_JUMP)
+                elif event.key == pygame.K_HOME:
+                    game.seek(0)
+                elif event.key == pygame.K_END:
+                    game.seek(game.get_history().get_length())
+                elif event.key == pygame.K_UP:
+                    game.change_variation(-1)
+                elif event.key == pygame.K_DOWN:
+                    game.change_variation(1)
+
         game.update()
 
 
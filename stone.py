@@ -3,12 +3,13 @@ from constants import SQUARE_SIZE, W, B
 
 
 class Stone:
-    PADDING = 10
-    RADIUS = SQUARE_SIZE // 2 - PADDING
+    PADDING = 4  # padding is a quarter of the square, so small squares on large boards still get a stone
 
-    def __init__(self, row, col, color):
+    def __init__(self, row, col, color, square_size=SQUARE_SIZE):
         self.row = row
         self.col = col
+        self.square_size = square_size
+        self.radius = square_size // 2 - square_size // self.PADDING
         if color == "W":
             self.color = W
         else:
@@ -18,11 +19,11 @@ class Stone:
         self.calc_pos()
 
     def calc_pos(self):
-        self.x = SQUARE_SIZE * self.col + SQUARE_SIZE // 2
-        self.y = SQUARE_SIZE * self.row + SQUARE_SIZE // 2
+        self.x = self.square_size * self.col + self.square_size // 2
+        self.y = self.square_size * self.row + self.square_size // 2
 
     def draw(self, win):
         pygame.draw.circle(win,
                            self.color,
                            (self.x, self.y),
-                           self.RADIUS)
+                           self.radius)